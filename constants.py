@@ -25,3 +25,9 @@ GREEN = (0, 255, 0)
 ORANGE = (244, 187, 68)
 PINK = (255, 192, 203)
 PURPLE = (255, 20, 147)
+
+# memory bounded searches: the most Cubes a search may hold at once, the most Cubes it may expand and the amount of
+# Cubes beam search keeps per layer
+MAX_NODES = 10000
+MAX_EXPANDED = 500000
+BEAM_WIDTH = 16
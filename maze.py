@@ -1,4 +1,5 @@
 """A Graphical representation of the following search algorithms:BFS,DFS,double BFS,Dijckstraw,A Star.
+And of the memory bounded searches: IDA Star, frontier search and beam search.
 
 The user can draw walls or let the program draw maze randomly , pick a starting and ending point , pick an algorithm
 and start the search .
@@ -14,17 +15,26 @@ In addition have a few methods"
     :method draw_grid: Draws the 'empty' grid
     :method manhattan_distance: counts Manhattan distance between two points
     :method restore_path: goes back through the father till there are no more and builds a path
+    :method build_path: goes back through the father till there are no more and returns the positions on the way
     :method check_neighbor: checks if the current Cube is the target
     :method iterations: a single iteration of the searching algorithm (in a aze concept this step is the same for all
                         except from DFS)
     :method DFSIteration: the same as 'Iterations' but the neighbors are picked randomly and it uses a stack instead of
                         a queue
+    :method multi_iterations: a single iteration of a one-to-many or many-to-one search
+    :method multi_search: finds the paths between one point and many points with a single BFS expansion
+    :method open_neighbors: returns the neighbors of a point which are inside the maze and are not walls
+    :method ida_star: IDA Star, keeps only the current path and a table of limited size in memory
+    :method frontier_search: divide and conquer BFS from both ends that keeps no closed list
+    :method beam_search: keeps only the best 'beamWidth' Cubes on each layer of the search
+    :method bounded_search: runs one of the memory bounded searches on the grid and draws its path
     :method main: builds a grid and enters an infinite while loop which updates the grid all the time and starts
                   different search algorithms according to what the user choose.
 """
 
 import pygame
 import random
+from collections import deque
 from constants import *
 
 
@@ -88,6 +98,9 @@ class Grid:
     :method get_pos: gets the position of the cube in the maze
     :method random_walls: draws maze randomly
     :method reset_grid: resets all the objects in the grid such as buttons and Cubes.
+    :method multi_mode: checks if there is more than one start or more than one target on the grid
+    :method reset_goals: clears the found paths and counts the goals a one-to-many or many-to-one search has to settle
+    :method draw_report: draws the report of the last memory bounded search under the Play and Reset buttons
 
     :atr self.isIterating: a flag that shows if the search has started
     :type self.isIterating: bool
@@ -101,6 +114,17 @@ class Grid:
     :type self.startPos: list
     :atr self.targetPos: will contain the positions of the target point
     :type self.targetPos: list
+    :atr self.extraStartsPos: positions of the additional starting points (many-to-one search)
+    :type self.extraStartsPos: list[tuple]
+    :atr self.extraTargetsPos: positions of the additional target points (one-to-many search)
+    :type self.extraTargetsPos: list[tuple]
+    :atr self.paths: the path and distance of every goal that was found, by the position of the goal
+    :type self.paths: dict
+    :atr self.goalsLeft: amount of goals that were not found yet
+    :type self.goalsLeft: int
+    :atr self.report: what the last memory bounded search cost (see 'ida_star') and whether it "found" a path, None if
+                      no such search was run
+    :type self.report: dict
     :atr self.grays: a priority queue that contains the Cubes
     :type self.grays: list
     :atr self.secondGrays: a priority queue that contains the Cubes (used only for Double BFS)
@@ -126,14 +150,21 @@ class Grid:
         self.randomW = False
         self.startPos = []
         self.targetPos = []
+        self.extraStartsPos = []
+        self.extraTargetsPos = []
+        self.paths = {}
+        self.goalsLeft = 0
+        self.report = None
         self.grays = []
         self.secondGrays = []
-        self.algorithm_buttons = {"BFS": Button(770, 220, 'BFS'), "DFS": Button(770, 270, 'DFS'),
-                                  "DBFS": Button(770, 320, 'DoubleBFS'), "Dijkstra":Button(770, 370, 'Dijkstra'),
-                                   "A*": Button(770, 420, 'A*')}
+        self.algorithm_buttons = {"BFS": Button(720, 220, 'BFS'), "DFS": Button(720, 270, 'DFS'),
+                                  "DBFS": Button(720, 320, 'DoubleBFS'), "Dijkstra":Button(720, 370, 'Dijkstra'),
+                                   "A*": Button(720, 420, 'A*'), "IDA*": Button(840, 220, 'IDA*'),
+                                  "Frontier": Button(840, 270, 'Frontier'), "Beam": Button(840, 320, 'Beam')}
         self.play_reset_buttons = {"Play": Button(720, 550, 'Play'), "Reset":Button(840, 550, 'Reset')}
         self.objects_buttons = {"Draw": Button(720, 50, 'Draw'), "Random": Button(840, 50, 'Random'),
-                                "Start": Button(720, 100, 'Start'), "Target": Button(840, 100, 'Target')}
+                                "Start": Button(720, 100, 'Start'), "Target": Button(840, 100, 'Target'),
+                                "+Start": Button(720, 140, '+Start'), "+Target": Button(840, 140, '+Target')}
 
     def maintain_buttons(self, buttons, win):
         """maintains the button sets in a way that only one button can be pressed.
@@ -198,6 +229,18 @@ class Grid:
             while self.isIterating:
                 DFSIteration(self)
 
+        def quickMulti():
+            """Clears the maze and runs the one-to-many or many-to-one search quickly without the visualization ."""
+            clear_maze()
+            self.reset_goals()
+            while self.isIterating:
+                multi_iterations(self)
+
+        def quickBounded():
+            """Clears the maze and runs the memory bounded search again."""
+            clear_maze()
+            bounded_search(self)
+
         # if "random" is pressed then draw random walls and disable the random function with self.randomW flag
         if self.objects_buttons["Random"].pressed and not self.isIterating:
             if not self.randomW:
@@ -218,8 +261,9 @@ class Grid:
                 # enter current position of start to startPos and mark it on maze
                 # OR the game was played and we want to move the START point then we can move but not on a WALL
                 elif self.objects_buttons["Start"].pressed:
-                    if (self.maze[row][col] == SPACE and not self.isIterating) or(self.maze[row][col] != WALL and
-                                            not self.isIterating and self.isPlayed and self.maze[row][col] != TARGET):
+                    if ((self.maze[row][col] == SPACE and not self.isIterating) or(self.maze[row][col] != WALL and
+                                            not self.isIterating and self.isPlayed and self.maze[row][col] != TARGET))\
+                            and (row, col) not in self.extraStartsPos:
                         if len(self.startPos) != 0:
                             self.maze[self.startPos[0]][self.startPos[1]] = 0
                             self.startPos.pop()
@@ -234,7 +278,9 @@ class Grid:
                             self.isIterating = True
                             self.secondGrays.clear()
                             self.secondGrays.append(Cube(self.targetPos[0], self.targetPos[1]))
-                            if self.algorithm_buttons["BFS"].pressed:
+                            if self.multi_mode():
+                                quickMulti()
+                            elif self.algorithm_buttons["BFS"].pressed:
                                 quickBFS(self.grays)
                             elif self.algorithm_buttons["DFS"].pressed:
                                 quickDFS()
@@ -244,10 +290,14 @@ class Grid:
                                 quickBFS(self.grays)
                             elif self.algorithm_buttons["A*"].pressed:
                                 quickBFS(self.grays)
+                            elif self.algorithm_buttons["IDA*"].pressed or self.algorithm_buttons["Frontier"].pressed\
+                                    or self.algorithm_buttons["Beam"].pressed:
+                                quickBounded()
                 # the same as on the previous button but with target
                 elif self.objects_buttons["Target"].pressed:
-                    if (self.maze[row][col] == SPACE and not self.isIterating) or(self.maze[row][col] != WALL and not self.isIterating
-                                and self.isPlayed and self.maze[row][col] != START):
+                    if ((self.maze[row][col] == SPACE and not self.isIterating) or(self.maze[row][col] != WALL and not self.isIterating
+                                and self.isPlayed and self.maze[row][col] != START))\
+                            and (row, col) not in self.extraTargetsPos:
                         if len(self.targetPos) != 0:
                             self.maze[self.targetPos[0]][self.targetPos[1]] = 0
                             self.targetPos.pop()
@@ -262,7 +312,9 @@ class Grid:
                             self.grays.clear()
                             self.grays.append(Cube(self.startPos[0], self.startPos[1]))
                             self.isIterating = True
-                            if self.algorithm_buttons["BFS"].pressed:
+                            if self.multi_mode():
+                                quickMulti()
+                            elif self.algorithm_buttons["BFS"].pressed:
                                 quickBFS(self.grays)
                             elif self.algorithm_buttons["DFS"].pressed:
                                 quickDFS()
@@ -272,16 +324,38 @@ class Grid:
                                 quickBFS(self.grays)
                             elif self.algorithm_buttons["A*"].pressed:
                                 quickBFS(self.grays)
+                            elif self.algorithm_buttons["IDA*"].pressed or self.algorithm_buttons["Frontier"].pressed\
+                                    or self.algorithm_buttons["Beam"].pressed:
+                                quickBounded()
+                # '+Start' and '+Target' add another start or target instead of moving the existing one.
+                # They can be placed only before the search was played.
+                elif self.objects_buttons["+Start"].pressed:
+                    if self.maze[row][col] == SPACE and not self.isIterating and not self.isPlayed:
+                        self.extraStartsPos.append((row, col))
+                        self.maze[row][col] = START
+                elif self.objects_buttons["+Target"].pressed:
+                    if self.maze[row][col] == SPACE and not self.isIterating and not self.isPlayed:
+                        self.extraTargetsPos.append((row, col))
+                        self.maze[row][col] = TARGET
         # resets the grid if reset button is pressed
         if self.play_reset_buttons["Reset"].pressed:
             self.reset_grid()
         # if play is pressed then checks that target and start are positioned on the grid and that
         # one of the algorithms is picked.
+        # with several starts or several targets only BFS and Dijkstra can be used (a single expansion answers all the
+        # goals) and it is either one-to-many or many-to-one
         elif self.play_reset_buttons["Play"].pressed and not self.isPlayed:
-            if len(self.startPos) != 0 and len(self.targetPos) != 0\
-                    and (self.algorithm_buttons["BFS"].pressed or self.algorithm_buttons["DFS"].pressed
-                    or self.algorithm_buttons["DBFS"].pressed or self.algorithm_buttons["Dijkstra"].pressed
-                    or self.algorithm_buttons["A*"].pressed):
+            if self.multi_mode():
+                algorithmPicked = (self.algorithm_buttons["BFS"].pressed or self.algorithm_buttons["Dijkstra"].pressed)\
+                                  and not (self.extraStartsPos and self.extraTargetsPos)
+            else:
+                algorithmPicked = self.algorithm_buttons["BFS"].pressed or self.algorithm_buttons["DFS"].pressed\
+                                  or self.algorithm_buttons["DBFS"].pressed or self.algorithm_buttons["Dijkstra"].pressed\
+                                  or self.algorithm_buttons["A*"].pressed or self.algorithm_buttons["IDA*"].pressed\
+                                  or self.algorithm_buttons["Frontier"].pressed or self.algorithm_buttons["Beam"].pressed
+            if len(self.startPos) != 0 and len(self.targetPos) != 0 and algorithmPicked:
+                if not self.isIterating:
+                    self.reset_goals()
                 self.isIterating = True
                 for b in self.algorithm_buttons.values():
                     b.locked = True
@@ -323,6 +397,31 @@ class Grid:
                 elif self.maze[i][j] == CHECKED_CUBE_2:
                     pygame.draw.rect(win, PINK,
                                      (CUBE_SIZE * j + 1, CUBE_SIZE * i + 1, CUBE_SIZE - 1, CUBE_SIZE - 1))
+        self.draw_report(win)
+
+    def draw_report(self, win):
+        """draws the report of the last memory bounded search under the Play and Reset buttons
+
+        :param win: our Pygame interface
+        """
+        pygame.draw.rect(win, WHITE, (720, 590, 230, 90))
+        if self.report is None:
+            return
+        if self.report["capped"]:
+            result = 'memory cap reached'
+        elif self.report["exhausted"]:
+            result = 'expansion limit reached'
+        elif not self.report["found"]:
+            result = 'no path found'
+        elif self.report["optimal"]:
+            result = 'shortest path'
+        else:
+            result = 'may not be shortest'
+        pygame.font.init()
+        my_font = pygame.font.SysFont('Comic Sans MS', 16)
+        for i, text in enumerate(['expanded: ' + str(self.report["expanded"]),
+                                  'peak nodes: ' + str(self.report["peak"]), result]):
+            win.blit(my_font.render(text, False, BLACK), (720, 590 + 25*i))
 
     def get_pos(self, pos):
         """gets position on maze and translates it to the position on maze
@@ -350,6 +449,21 @@ class Grid:
                         else:
                             self.maze[i][j] = WALL
 
+    def multi_mode(self):
+        """checks if there is more than one start or more than one target on the grid
+
+        :return: True if the search is one-to-many or many-to-one
+        """
+        return len(self.extraStartsPos) != 0 or len(self.extraTargetsPos) != 0
+
+    def reset_goals(self):
+        """clears the found paths and counts the goals a one-to-many or many-to-one search has to settle"""
+        self.paths = {}
+        if len(self.extraStartsPos) != 0:
+            self.goalsLeft = len(self.extraStartsPos) + 1
+        else:
+            self.goalsLeft = len(self.extraTargetsPos) + 1
+
     def reset_grid(self):
         """Resets the grid by resetting all the buttons and clearing the maze to starting point.
 
@@ -365,6 +479,11 @@ class Grid:
         self.isPlayed = False
         self.targetPos = []
         self.startPos = []
+        self.extraStartsPos = []
+        self.extraTargetsPos = []
+        self.paths = {}
+        self.goalsLeft = 0
+        self.report = None
         reset_buttons(self.objects_buttons)
         reset_buttons(self.play_reset_buttons)
         reset_buttons(self.algorithm_buttons)
@@ -478,8 +597,23 @@ def manhattan_distance(currnetRow, currentCol, targetRow, targetCol):
 def restore_path(maze, current):
     """goes back through the father till there are no more and builds a path"""
     while current.parent:
-        maze[current.row][current.col] = PATH
+        # other starts and targets may lie on the path when there are several of them
+        if maze[current.row][current.col] != START and maze[current.row][current.col] != TARGET:
+            maze[current.row][current.col] = PATH
+        current = current.parent
+
+
+def build_path(current):
+    """goes back through the father till there are no more and returns the positions on the way
+
+    :param current: the last Cube of the path
+    :return: list of (row, col) from 'current' back to the first Cube
+    """
+    path = []
+    while current:
+        path.append((current.row, current.col))
         current = current.parent
+    return path
 
 
 def check_neighbor(grid, list, target, marked, current, row, col):
@@ -493,8 +627,28 @@ def check_neighbor(grid, list, target, marked, current, row, col):
     :param row: row of 'current' Cube
     :param col: column of 'current' Cube
     """
+    # if one of several goals found then save its path and distance and keep expanding (also through the goal itself)
+    # until all the goals are found.
+    # The path always goes from the start to the target, so it is reversed when the search began from the start.
+    if grid.maze[row][col] == target and grid.multi_mode():
+        if (row, col) not in grid.paths:
+            restore_path(grid.maze, current)
+            goalCube = Cube(row, col, current)
+            if grid.algorithm_buttons["Dijkstra"].pressed:
+                goalCube.g = current.g + 1
+            goalCube.f = goalCube.g
+            path = build_path(goalCube)
+            if target == TARGET:
+                path.reverse()
+            grid.paths[(row, col)] = (path, len(path) - 1)
+            grid.goalsLeft -= 1
+            list.append(goalCube)
+            if grid.goalsLeft == 0:
+                grid.isIterating = False
+                grid.isPlayed = True
+                grid.play_reset_buttons["Play"].unpress()
     # if targert found
-    if grid.maze[row][col] == target:
+    elif grid.maze[row][col] == target:
         grid.isIterating = False
         grid.isPlayed = True
         grid.play_reset_buttons["Play"].unpress()
@@ -552,7 +706,8 @@ def iterations(grid, list, start=START, target=TARGET, checked=CHECKED_CUBE, mar
         current = list.pop(0)
         row = current.row
         col = current.col
-        if grid.maze[row][col] != start:
+        # a found target stays in the list when there are several targets, so it keeps its color as well
+        if grid.maze[row][col] != start and grid.maze[row][col] != target:
             grid.maze[row][col] = checked
         if grid.isIterating:
             if grid.maze[row+1][col] == SPACE or grid.maze[row+1][col] == target:
@@ -607,6 +762,295 @@ def DFSIteration(grid):
                         check_neighbor(grid, grid.grays, TARGET, MARKED_CUBE, current, row, col - 1)
 
 
+def multi_iterations(grid):
+    """A single iteration of a one-to-many or many-to-one search.
+
+    One-to-many expands from the start and stops when all the targets are found, many-to-one expands from the target
+    and stops when all the starts are found (the maze is not directed so the distances are the same).
+    """
+    if len(grid.extraStartsPos) != 0:
+        iterations(grid, grid.secondGrays, TARGET, START)
+    else:
+        iterations(grid, grid.grays)
+
+
+def multi_search(maze, sources, targets):
+    """Finds the shortest paths between one point and many points with a single BFS expansion.
+
+    Either 'sources' or 'targets' has to contain a single point. The search expands from that point and stops as soon
+    as every point on the other side is settled, instead of running a full search for each of them.
+
+    :param maze: the maze itself in numbers, every number except WALL can be passed
+    :type maze: list[int*int]
+    :param sources: (row, col) of the starting points
+    :type sources: list[tuple]
+    :param targets: (row, col) of the target points
+    :type targets: list[tuple]
+    :return: for every point of the 'many' side that can be reached - its path from source to target and its distance
+    :rtype: dict
+    """
+    if len(sources) != 1 and len(targets) != 1:
+        raise ValueError("either sources or targets must contain a single point")
+    fromSource = len(sources) == 1
+    root = tuple(sources[0]) if fromSource else tuple(targets[0])
+    goals = set(tuple(p) for p in (targets if fromSource else sources))
+    found = {}
+    seen = {root}
+    queue = deque([Cube(root[0], root[1])])
+    while queue and len(found) < len(goals):
+        current = queue.popleft()
+        if (current.row, current.col) in goals:
+            path = build_path(current)
+            if fromSource:
+                path.reverse()
+            found[(current.row, current.col)] = (path, current.g)
+        for row, col in open_neighbors(maze, current.row, current.col):
+            if (row, col) not in seen:
+                seen.add((row, col))
+                newCube = Cube(row, col, current)
+                newCube.g = current.g + 1
+                queue.append(newCube)
+    return found
+
+
+def open_neighbors(maze, row, col):
+    """returns the neighbors of a point which are inside the maze and are not walls
+
+    :return: list of (row, col)
+    """
+    return [(r, c) for r, c in ((row+1, col), (row-1, col), (row, col+1), (row, col-1))
+            if 0 <= r < len(maze) and 0 <= c < len(maze[r]) and maze[r][c] != WALL]
+
+
+def ida_star(maze, start, target, maxNodes=MAX_NODES, maxExpanded=MAX_EXPANDED):
+    """IDA Star, keeps only the current path and a table of limited size in memory.
+
+    A depth first search that cuts every path whose f is bigger than a bound, and raises the bound to the smallest f
+    that was cut until the target is found. The table keeps the smallest g each Cube was reached with and the round it
+    was reached on, so it is not expanded again by a longer path or twice on the same round, and it stops growing when
+    the memory is full. The path is still the shortest one, but every round expands again all the Cubes of the previous
+    rounds, and once the table is full Cubes that can be reached by several paths are expanded once for each path.
+
+    All the memory bounded searches return the same report:
+        "expanded" - amount of Cubes that were expanded (the speed that was traded away)
+        "peak" - the biggest amount of Cubes that were held at once, counting only the main structure of each search:
+                 the path and the table for IDA Star (not the untried neighbors of the Cubes on the path, at most 4
+                 each), the layers for frontier search (not the parts of the path that were already found) and the
+                 kept Cubes and the new layer for beam search
+        "optimal" - whether the path is sure to be the shortest (the optimality that was traded away)
+        "capped" - whether the search gave up because it needed more than 'maxNodes' Cubes
+        "exhausted" - whether the search gave up because it had to expand more than 'maxExpanded' Cubes
+
+    :param maze: the maze itself in numbers, every number except WALL can be passed
+    :param start: (row, col) of the start
+    :param target: (row, col) of the target
+    :param maxNodes: the most Cubes the search may hold at once
+    :param maxExpanded: the most Cubes the search may expand
+    :return: the path from start to target (None if not found) and the report
+    :rtype: tuple
+    """
+    start, target = tuple(start), tuple(target)
+    report = {"expanded": 0, "peak": 1, "optimal": True, "capped": False, "exhausted": False}
+
+    def by_distance(row, col):
+        """the open neighbors of a point, the closest to the target first"""
+        return iter(sorted(open_neighbors(maze, row, col), key=lambda p: manhattan_distance(p[0], p[1], *target)))
+
+    if start == target:
+        return [start], report
+    bound = manhattan_distance(*start, *target)
+    table = {start: (0, 0)}
+    rounds = 0
+    while True:
+        rounds += 1
+        path = [start]
+        onPath = {start}
+        # the untried neighbors of every Cube on the path
+        stack = [by_distance(*start)]
+        report["expanded"] += 1
+        nextBound = None
+        while stack:
+            neighbor = next(stack[-1], None)
+            if neighbor is None:
+                stack.pop()
+                onPath.discard(path.pop())
+                continue
+            if neighbor in onPath:
+                continue
+            g = len(path)
+            if neighbor in table and (table[neighbor][0] < g or table[neighbor] == (g, rounds)):
+                continue
+            f = g + manhattan_distance(*neighbor, *target)
+            if f > bound:
+                if nextBound is None or f < nextBound:
+                    nextBound = f
+                continue
+            if neighbor in table or len(table) + len(path) < maxNodes:
+                table[neighbor] = (g, rounds)
+            path.append(neighbor)
+            onPath.add(neighbor)
+            if neighbor == target:
+                return path, report
+            # the path comes first, the table gives its latest Cubes back to it
+            while len(path) + len(table) > maxNodes and len(table) != 0:
+                table.popitem()
+            if len(path) > maxNodes:
+                report["capped"] = True
+                return None, report
+            report["peak"] = max(report["peak"], len(path) + len(table))
+            if report["expanded"] >= maxExpanded:
+                report["exhausted"] = True
+                return None, report
+            report["expanded"] += 1
+            stack.append(by_distance(*neighbor))
+        # nothing was cut so there is no path at all
+        if nextBound is None:
+            return None, report
+        bound = nextBound
+
+
+def frontier_search(maze, start, target, maxNodes=MAX_NODES, maxExpanded=MAX_EXPANDED):
+    """Divide and conquer BFS from both ends that keeps no closed list.
+
+    Each side keeps only its last two layers (in a maze that is not directed the next layer can't go back further), so
+    there are no parents to restore the path from. When the two sides meet, the meeting point is the middle of a
+    shortest path and the same search is run again between the start and the middle and between the middle and the
+    target. The path is the shortest one, but the Cubes are expanded again on every level of the division.
+
+    :param maze: the maze itself in numbers, every number except WALL can be passed
+    :param start: (row, col) of the start
+    :param target: (row, col) of the target
+    :param maxNodes: the most Cubes the search may hold at once
+    :param maxExpanded: the most Cubes the search may expand
+    :return: the path from start to target (None if not found) and the report (see 'ida_star')
+    :rtype: tuple
+    """
+    report = {"expanded": 0, "peak": 1, "optimal": True, "capped": False, "exhausted": False}
+
+    def middle(first, last):
+        """BFS from both ends, returns the distance and the meeting point or None if they don't meet"""
+        if first == last:
+            return 0, first
+        # the previous and the current layer of each side
+        layers = [(set(), {first}), (set(), {last})]
+        depths = [0, 0]
+        side = 0
+        while True:
+            previous, current = layers[side]
+            layer = set()
+            for row, col in current:
+                if report["expanded"] >= maxExpanded:
+                    report["exhausted"] = True
+                    return None
+                report["expanded"] += 1
+                for neighbor in open_neighbors(maze, row, col):
+                    if neighbor not in previous and neighbor not in current:
+                        layer.add(neighbor)
+            if len(layer) == 0:
+                return None
+            layers[side] = (current, layer)
+            depths[side] += 1
+            held = sum(len(previous) + len(current) for previous, current in layers)
+            report["peak"] = max(report["peak"], held)
+            if held > maxNodes:
+                report["capped"] = True
+                return None
+            meeting = layer & layers[1 - side][1]
+            if len(meeting) != 0:
+                return depths[0] + depths[1], min(meeting)
+            # the sides take turns so when the distance is 2 or more the meeting point is not one of the ends
+            side = 1 - side
+
+    def divide(first, last):
+        """finds the path between two points by dividing it at the meeting point"""
+        found = middle(first, last)
+        if found is None:
+            return None
+        distance, point = found
+        if distance == 0:
+            return [first]
+        if distance == 1:
+            return [first, last]
+        firstHalf = divide(first, point)
+        secondHalf = divide(point, last)
+        if firstHalf is None or secondHalf is None:
+            return None
+        return firstHalf + secondHalf[1:]
+
+    return divide(tuple(start), tuple(target)), report
+
+
+def beam_search(maze, start, target, beamWidth=BEAM_WIDTH, maxNodes=MAX_NODES, maxExpanded=MAX_EXPANDED):
+    """Keeps only the best 'beamWidth' Cubes on each layer of the search.
+
+    A BFS where the Cubes of every new layer are sorted by their distance to the target and only the first
+    'beamWidth' of them are kept. The memory grows only by 'beamWidth' on each layer, but when Cubes are dropped the
+    path may not be the shortest one, or not found at all although there is one.
+
+    :param maze: the maze itself in numbers, every number except WALL can be passed
+    :param start: (row, col) of the start
+    :param target: (row, col) of the target
+    :param beamWidth: amount of Cubes kept on each layer
+    :param maxNodes: the most Cubes the search may hold at once
+    :param maxExpanded: the most Cubes the search may expand
+    :return: the path from start to target (None if not found) and the report (see 'ida_star')
+    :rtype: tuple
+    """
+    start, target = tuple(start), tuple(target)
+    report = {"expanded": 0, "peak": 1, "optimal": True, "capped": False, "exhausted": False}
+    if start == target:
+        return [start], report
+    # every kept Cube may stay alive as a parent of the next layers, so all of them are counted
+    kept = {start}
+    beam = [Cube(start[0], start[1])]
+    while len(beam) != 0:
+        layer = {}
+        for current in beam:
+            if report["expanded"] >= maxExpanded:
+                report["exhausted"] = True
+                return None, report
+            report["expanded"] += 1
+            for row, col in open_neighbors(maze, current.row, current.col):
+                if (row, col) == target:
+                    path = build_path(Cube(row, col, current))
+                    path.reverse()
+                    return path, report
+                if (row, col) not in kept and (row, col) not in layer:
+                    layer[(row, col)] = Cube(row, col, current)
+        beam = sorted(layer.values(), key=lambda x: manhattan_distance(x.row, x.col, *target))
+        if len(beam) > beamWidth:
+            # dropped Cubes may have been on the shortest path
+            report["optimal"] = False
+            beam = beam[:beamWidth]
+        kept.update((cube.row, cube.col) for cube in beam)
+        held = len(kept) + len(layer)
+        report["peak"] = max(report["peak"], held)
+        if held > maxNodes:
+            report["capped"] = True
+            return None, report
+    return None, report
+
+
+def bounded_search(grid):
+    """Runs one of the memory bounded searches on the grid and draws its path.
+
+    These searches don't keep a list of Cubes that can be shown step by step, so the whole search is run at once.
+    """
+    if grid.algorithm_buttons["IDA*"].pressed:
+        path, grid.report = ida_star(grid.maze, grid.startPos, grid.targetPos)
+    elif grid.algorithm_buttons["Frontier"].pressed:
+        path, grid.report = frontier_search(grid.maze, grid.startPos, grid.targetPos)
+    else:
+        path, grid.report = beam_search(grid.maze, grid.startPos, grid.targetPos)
+    grid.report["found"] = path is not None
+    if path:
+        for row, col in path[1:-1]:
+            grid.maze[row][col] = PATH
+    grid.isIterating = False
+    grid.isPlayed = True
+    grid.play_reset_buttons["Play"].unpress()
+
+
 def main():
     """builds a grid and enters an infinite while loop which updates the grid all the time and starts different search
      algorithms according to what the user choose.
@@ -628,7 +1072,9 @@ def main():
 
         if grid.isIterating and not grid.isPlayed:
             # starts the algorithm the user choose
-            if grid.algorithm_buttons["BFS"].pressed:
+            if grid.multi_mode():
+                multi_iterations(grid)
+            elif grid.algorithm_buttons["BFS"].pressed:
                 iterations(grid, grid.grays)
             elif grid.algorithm_buttons["DFS"].pressed:
                 DFSIteration(grid)
@@ -639,10 +1085,14 @@ def main():
                 iterations(grid, grid.secondGrays, TARGET, MARKED_CUBE, CHECKED_CUBE_2, MARKED_CUBE_2)
             elif grid.algorithm_buttons["A*"].pressed:
                 iterations(grid, grid.grays)
+            elif grid.algorithm_buttons["IDA*"].pressed or grid.algorithm_buttons["Frontier"].pressed\
+                    or grid.algorithm_buttons["Beam"].pressed:
+                bounded_search(grid)
         grid.update(window)
 
         draw_grid(window)
 
 
-main()
+if __name__ == "__main__":
+    main()
 